@@ -1,11 +1,38 @@
 import os
+import re
 import sys
+import glob
 import json
+import mmap
+import struct
+import hashlib
+import functools
+import queue
+import atexit
 import shutil
 import zipfile
 import tempfile
+import contextlib
+import threading
 import subprocess
-from typing import Optional
+from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+try:
+    import readline
+except ImportError:
+    readline = None
 
 try:
     from rich.console import Console
@@ -20,10 +47,18 @@ except ImportError:
     print("\n  Missing dependency — install with:  pip3 install rich\n")
     sys.exit(1)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 C = Console(highlight=False)
 
 EXIFOR_VERSION = "1.3.0"
 
+NONINTERACTIVE = False
+
 A = "cyan"
 G = "#00c87a"
 Y = "#e3cd0b"
@@ -32,7 +67,7 @@ D = "bright_black"
 W = "white"
 P = "#ed66e9"
 
-MEDIA = {
+MEDIA = frozenset({
     ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".heic", ".heif",
     ".gif", ".bmp", ".webp", ".raw", ".cr2", ".cr3", ".nef",
     ".arw", ".dng", ".orf", ".rw2", ".pef",
@@ -40,11 +75,99 @@ MEDIA = {
     ".mp3", ".flac", ".m4a", ".wav", ".aac", ".ogg",
     ".pdf", ".docx", ".xlsx", ".pptx",
     ".zip",
-}
+})
+
+
+def env_int(name: str, default: int, low: int = 1) -> int:
+    try:
+        return max(low, int(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
+
+
+ZIP_WORKERS = env_int("EXIFOR_THREADS", 4)
+ZIP_CHUNK = 64
+DIR_WORKERS = env_int("EXIFOR_THREADS", 8)
+DIR_CHUNK = 32
+ZIP_LEVEL = 1
+ZIP_PREFETCH = 8
+FAST_MAX = min(2, env_int("EXIFOR_FAST", 2, low=0))
+
+PRECOMPRESSED = frozenset({
+    ".jpg", ".jpeg", ".png", ".gif", ".heic", ".heif", ".webp",
+    ".mp4", ".mov", ".m4v", ".m4a", ".mp3", ".flac",
+    ".zip",
+})
+
+HEADER_ONLY = frozenset({".jpg", ".jpeg", ".png"})
+HEADER_BYTES = 256 << 10
+
+
+RAMDIR = next(
+    (d for d in ("/dev/shm", os.environ.get("XDG_RUNTIME_DIR", ""))
+     if d and os.path.isdir(d) and os.access(d, os.W_OK)),
+    None,
+)
+
+
+def mem_available() -> int:
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def scratch_dir(need: int = 0) -> str:
+    if RAMDIR and need < mem_available():
+        return tempfile.mkdtemp(prefix="exifor_", dir=RAMDIR)
+    return tempfile.mkdtemp(prefix="exifor_")
+
+
+ZIP_CLEAN: dict = {}
+READ_CACHE: dict = {}
+READ_CACHE_SIZE = 128
+ZIP_META: dict = {}
+ZIP_META_SIZE = 8
+
+
+def cache_put(cache: dict, key, value, limit: int):
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > limit:
+        cache.pop(next(iter(cache)))
+    return value
+
+
+def scan_zip(path: str) -> tuple:
+    with zipfile.ZipFile(path, "r") as zf:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+    h = hashlib.blake2b(digest_size=16)
+    for info in infos:
+        h.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\0".encode())
+    st = os.stat(path)
+    return [info.filename for info in infos], (os.path.realpath(path), st.st_mtime_ns, h.hexdigest())
+
+
+def zip_cleaned(key: tuple) -> Optional[str]:
+    out = ZIP_CLEAN.get(key)
+    if out is None:
+        return None
+    try:
+        if out == key[0] or ZIP_CLEAN.get(scan_zip(out)[1]) == out:
+            return out
+    except (OSError, zipfile.BadZipFile):
+        pass
+    del ZIP_CLEAN[key]
+    return None
 
 
 def clear():
-    os.system("clear")
+    C.file.write("\x1b[H\x1b[2J")
+    C.file.flush()
 
 
 def rule(label: str = ""):
@@ -67,18 +190,70 @@ def warn(msg):
 
 
 def pause():
+    if NONINTERACTIVE:
+        return
     C.print(f"  [{D}]Press Enter to continue...[/]", end="")
     input()
 
 
+@contextlib.contextmanager
+def cbreak(fd: int):
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def getch() -> str:
+    if not sys.stdin.isatty() or (termios is None and msvcrt is None):
+        return input().strip()
+    if termios is not None:
+        with cbreak(sys.stdin.fileno()):
+            ch = sys.stdin.read(1)
+    else:
+        ch = msvcrt.getwch()
+    if ch == "\x03":
+        raise KeyboardInterrupt
+    if ch in ("\x04", "\x1a"):
+        raise EOFError
+    ch = ch.strip()
+    C.print(ch)
+    return ch
+
+
+def path_completer(text: str, state: int) -> Optional[str]:
+    matches = sorted(glob.glob(os.path.expanduser(text) + "*"))
+    if state >= len(matches):
+        return None
+    m = matches[state]
+    return m + os.sep if os.path.isdir(m) else m
+
+
 def ask(prompt: str, default: str = "") -> str:
     hint = f" [{D}]{escape(default)}[/]" if default else ""
     C.print(f"  [{A}]{escape(prompt)}[/]{hint}  ", end="")
-    val = input().strip()
+    if readline is None or not sys.stdin.isatty():
+        val = input().strip()
+        return val if val else default
+    completer, delims = readline.get_completer(), readline.get_completer_delims()
+    readline.set_completer(path_completer)
+    readline.set_completer_delims(" \t\n")
+    readline.parse_and_bind(
+        "bind ^I rl_complete" if "libedit" in (readline.__doc__ or "") else "tab: complete"
+    )
+    try:
+        val = input().strip()
+    finally:
+        readline.set_completer(completer)
+        readline.set_completer_delims(delims)
     return val if val else default
 
 
 def yesno(prompt: str, default: bool = True) -> bool:
+    if NONINTERACTIVE:
+        return default
     hint = "Y/n" if default else "y/N"
     text = Text()
     text.append("  ")
@@ -90,35 +265,133 @@ def yesno(prompt: str, default: bool = True) -> bool:
     return v in ("y", "yes")
 
 
-def spin(label: str) -> Progress:
-    return Progress(SpinnerColumn(style=A), TextColumn(f"[{D}]{label}[/]"), transient=True)
+_SPIN = Progress(
+    SpinnerColumn(style=A), TextColumn(f"[{D}]{{task.description}}[/]"), console=C, transient=True,
+)
+
+
+@contextlib.contextmanager
+def spin(label: str):
+    with _SPIN:
+        task = _SPIN.add_task(label, total=None)
+        try:
+            yield lambda done, total: _SPIN.update(task, description=f"{label} {done}/{total}")
+        finally:
+            _SPIN.remove_task(task)
+
+
+TITLE = Text("  ExiFor", style=f"bold {A}")
 
 
 def header(title: str = "", sub: str = ""):
     clear()
-    t = Text()
-    t.append("  ExiFor", style=f"bold {A}")
+    t = TITLE.copy()
     if title:
         t.append(f"  ·  {title}", style=f"{Y}")
     if sub:
         t.append(f"  ·  {sub}", style=D)
-    C.print(t)
-    rule()
-    C.print()
+    with C:
+        C.print(t)
+        rule()
+        C.print()
+
+
+UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def sz_fmt(b: int) -> str:
+    if b < 1024:
+        return f"{b} B"
+    i = min((b.bit_length() - 1) // 10, 4)
+    return f"{b / (1 << (i * 10)):.1f} {UNITS[i]}"
 
 
-def sz(path: str) -> str:
+def sz(path: Union[str, int]) -> str:
     try:
-        b = os.path.getsize(path)
-        for u in ("B", "KB", "MB", "GB"):
-            if b < 1024:
-                return f"{b:.0f} {u}"
-            b /= 1024
-        return f"{b:.1f} TB"
+        return sz_fmt(path if isinstance(path, int) else os.path.getsize(path))
     except Exception:
         return "?"
 
 
+def entry_sz(entry: os.DirEntry) -> str:
+    try:
+        size = entry.stat().st_size
+    except OSError:
+        return "?"
+    return sz(size)
+
+
+def ext_of(name: str) -> str:
+    head, dot, ext = name.rpartition(".")
+    return "." + ext.lower() if dot and head else ""
+
+
+def ext_set(exts) -> Optional[frozenset]:
+    if not exts:
+        return None
+    if isinstance(exts, frozenset):
+        return exts
+    return frozenset("." + e.lower().lstrip(".") for e in exts)
+
+
+def iter_files(directory: str, exts: Optional[frozenset] = None):
+    want = ext_set(exts) or MEDIA
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        if not e.name.startswith("."):
+                            stack.append(e.path)
+                    elif e.is_file() and ext_of(e.name) in want and not e.name.endswith("_original"):
+                        yield e.path
+        except PermissionError:
+            continue
+
+
+def result_table() -> Table:
+    t = Table(show_header=False, box=box.SIMPLE, padding=(0, 2), expand=True)
+    t.add_column("", style=f"bold {D}", min_width=12)
+    t.add_column("", style=W, overflow="fold")
+    return t
+
+
+def tag_table() -> Table:
+    t = Table(show_header=False, box=box.SIMPLE, padding=(0, 1), expand=True)
+    t.add_column("Tag",   style=f"bold {W}", min_width=26)
+    t.add_column("Value", style=W, overflow="fold")
+    return t
+
+
+def gps_table() -> Table:
+    t = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
+    t.add_column("", style=D, min_width=16)
+    t.add_column("", style=W)
+    return t
+
+
+def zip_table() -> Table:
+    t = Table(show_header=True, header_style=f"bold {A}", box=box.SIMPLE_HEAD, padding=(0, 2))
+    t.add_column("File",       style=W, overflow="fold")
+    t.add_column("Tags found", style=Y, justify="right")
+    return t
+
+
+@functools.lru_cache(maxsize=8)
+def zip_panel(rows: tuple) -> tuple:
+    t = zip_table()
+    total_tags = 0
+    dirty = 0
+    for name, count in rows:
+        total_tags += count
+        if count > 0:
+            dirty += 1
+        color = R if count > 0 else G
+        t.add_row(escape(name), f"[{color}]{count}[/]")
+    return Panel(t, border_style=D, padding=(0, 1)), dirty, total_tags
+
+
 def show_result(
     success: bool,
     action: str,
@@ -131,10 +404,7 @@ def show_result(
     status_icon = "✓" if success else "✗"
     status_text = "Success" if success else "Failed"
 
-    t = Table(show_header=False, box=box.SIMPLE, padding=(0, 2), expand=True)
-    t.add_column("", style=f"bold {D}", min_width=12)
-    t.add_column("", style=W, overflow="fold")
-
+    t = result_table()
     t.add_row("Action", escape(action))
     t.add_row("Status", f"[bold {color}]{status_icon}  {status_text}[/]")
     t.add_row("Input", escape(input_path))
@@ -158,195 +428,894 @@ def show_result(
     C.print(Panel(t, title=f"[{title_style}]Result[/]", border_style=color, padding=(0, 1)))
 
 
+@functools.lru_cache(maxsize=128)
+def tag_argv(items: tuple) -> tuple:
+    return tuple(f"-{k}={v}" for k, v in items)
+
+
+def gps_tags(lat: float, lon: float, alt: Optional[float] = None) -> dict:
+    tags = {
+        "GPSLatitude": str(abs(lat)),
+        "GPSLatitudeRef": "N" if lat >= 0 else "S",
+        "GPSLongitude": str(abs(lon)),
+        "GPSLongitudeRef": "E" if lon >= 0 else "W",
+    }
+    if alt is not None:
+        tags["GPSAltitude"] = str(abs(alt))
+        tags["GPSAltitudeRef"] = "0" if alt >= 0 else "1"
+    return tags
+
+
+NATIVE_GPS = frozenset({".jpg", ".jpeg"})
+
+TIFF_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8, 11: 4, 12: 8, 13: 4}
+
+
+def jpeg_exif_span(buf) -> Optional[tuple]:
+    if buf[:2] != b"\xff\xd8":
+        return None
+    pos, n = 2, len(buf)
+    while pos + 4 <= n:
+        if buf[pos] != 0xFF:
+            return None
+        marker = buf[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        length = struct.unpack_from(">H", buf, pos + 2)[0]
+        if length < 2 or pos + 2 + length > n:
+            return None
+        if marker == 0xE1 and buf[pos + 4:pos + 10] == b"Exif\x00\x00":
+            return pos + 10, pos + 2 + length
+        pos += 2 + length
+    return None
+
+
+def tiff_drop_gps(seg: bytearray) -> Optional[bool]:
+    order = {b"II": "<", b"MM": ">"}.get(bytes(seg[:2]))
+    if order is None or len(seg) < 8 or struct.unpack_from(order + "H", seg, 2)[0] != 42:
+        return None
+    ifd0 = struct.unpack_from(order + "I", seg, 4)[0]
+    if ifd0 + 2 > len(seg):
+        return None
+    count = struct.unpack_from(order + "H", seg, ifd0)[0]
+    end0 = ifd0 + 2 + 12 * count + 4
+    if end0 > len(seg):
+        return None
+
+    for idx in range(count):
+        entry = ifd0 + 2 + 12 * idx
+        if struct.unpack_from(order + "H", seg, entry)[0] == 0x8825:
+            break
+    else:
+        return False
+
+    gps = struct.unpack_from(order + "I", seg, entry + 8)[0]
+    if gps + 2 > len(seg):
+        return None
+    n = struct.unpack_from(order + "H", seg, gps)[0]
+    gps_end = gps + 2 + 12 * n + 4
+    if gps_end > len(seg):
+        return None
+    blanks = [(gps, gps_end)]
+    for i in range(n):
+        e = gps + 2 + 12 * i
+        typ, cnt = struct.unpack_from(order + "HI", seg, e + 2)
+        size = TIFF_SIZES.get(typ)
+        if size is None:
+            return None
+        if size * cnt > 4:
+            off = struct.unpack_from(order + "I", seg, e + 8)[0]
+            if off + size * cnt > len(seg):
+                return None
+            blanks.append((off, off + size * cnt))
+
+    for start, stop in blanks:
+        seg[start:stop] = bytes(stop - start)
+    seg[entry:end0 - 12] = seg[entry + 12:end0]
+    seg[end0 - 12:end0] = bytes(12)
+    struct.pack_into(order + "H", seg, ifd0, count - 1)
+    return True
+
+
+FAST_COUNT = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff"})
+SUB_IFDS = frozenset({0x8769, 0x8825, 0xA005})
+PNG_SIG = b"\x89PNG\r\n\x1a\n"
+PNG_LAYOUT = frozenset({b"IHDR", b"PLTE", b"tRNS", b"gAMA", b"cHRM", b"sRGB", b"pHYs", b"sBIT", b"bKGD"})
+LAYOUT_TAGS = (
+    "--JFIF:all", "--Adobe:all",
+    "--PNG:ImageWidth", "--PNG:ImageHeight", "--PNG:BitDepth", "--PNG:ColorType",
+    "--PNG:Compression", "--PNG:Filter", "--PNG:Interlace", "--PNG:Palette", "--PNG:Transparency",
+    "--PNG:Gamma", "--PNG:WhitePointX", "--PNG:WhitePointY", "--PNG:RedX", "--PNG:RedY",
+    "--PNG:GreenX", "--PNG:GreenY", "--PNG:BlueX", "--PNG:BlueY", "--PNG:SRGBRendering",
+    "--PNG:PixelsPerUnitX", "--PNG:PixelsPerUnitY", "--PNG:PixelUnits",
+    "--PNG:SignificantBits", "--PNG:BackgroundColor",
+)
+
+
+def tiff_tag_count(seg) -> Optional[int]:
+    order = {b"II": "<", b"MM": ">"}.get(bytes(seg[:2]))
+    if order is None or len(seg) < 8 or struct.unpack_from(order + "H", seg, 2)[0] != 42:
+        return None
+    count, seen = 0, set()
+    todo = [(struct.unpack_from(order + "I", seg, 4)[0], True)]
+    while todo:
+        off, chained = todo.pop()
+        if off == 0 or off in seen:
+            continue
+        seen.add(off)
+        if off + 2 > len(seg):
+            return None
+        n = struct.unpack_from(order + "H", seg, off)[0]
+        end = off + 2 + 12 * n
+        if end + 4 > len(seg):
+            return None
+        for tag, _, _, value in struct.iter_unpack(order + "HHII", seg[off + 2:end]):
+            if tag in SUB_IFDS:
+                todo.append((value, False))
+            else:
+                count += 1
+        if chained:
+            todo.append((struct.unpack_from(order + "I", seg, end)[0], True))
+    return count
+
+
+def jpeg_tag_count(buf) -> Optional[int]:
+    pos, n, count = 2, len(buf), 0
+    while pos + 4 <= n:
+        if buf[pos] != 0xFF:
+            return None
+        marker = buf[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):
+            return count
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        length = struct.unpack_from(">H", buf, pos + 2)[0]
+        if length < 2 or pos + 2 + length > n:
+            return None
+        if marker == 0xE1 and buf[pos + 4:pos + 10] == b"Exif\x00\x00":
+            found = tiff_tag_count(buf[pos + 10:pos + 2 + length])
+            if found is None:
+                return None
+            count += found
+        elif marker == 0xEE and buf[pos + 4:pos + 9] == b"Adobe":
+            pass
+        elif marker == 0xFE or 0xE1 <= marker <= 0xEF:
+            return None
+        pos += 2 + length
+    return None
+
+
+def png_tag_count(buf) -> Optional[int]:
+    pos, n, count = 8, len(buf), 0
+    while pos + 8 <= n:
+        length, kind = struct.unpack_from(">I4s", buf, pos)
+        if kind in (b"IDAT", b"IEND"):
+            return count
+        end = pos + 12 + length
+        if end > n:
+            return None
+        if kind == b"eXIf":
+            found = tiff_tag_count(buf[pos + 8:pos + 8 + length])
+            if found is None:
+                return None
+            count += found
+        elif kind not in PNG_LAYOUT:
+            return None
+        pos = end
+    return None
+
+
+def fast_tag_count(buf) -> Optional[int]:
+    try:
+        if buf[:2] == b"\xff\xd8":
+            return jpeg_tag_count(buf)
+        if buf[:8] == PNG_SIG:
+            return png_tag_count(buf)
+        return tiff_tag_count(buf)
+    except struct.error:
+        return None
+
+
+def summarize(outputs) -> str:
+    totals, other = {}, []
+    for out in outputs:
+        for line in out.splitlines():
+            count, _, what = line.strip().partition(" ")
+            if count.isdigit() and what:
+                totals[what] = totals.get(what, 0) + int(count)
+            elif line.strip():
+                other.append(line.strip())
+    return "\n".join([f"{n} {what}" for what, n in totals.items()] + other)
+
+
+def fast_copy(src: str, dst: str):
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fi, open(dst, "wb") as fo:
+                left = os.fstat(fi.fileno()).st_size
+                while left > 0:
+                    n = os.copy_file_range(fi.fileno(), fo.fileno(), left)
+                    if n == 0:
+                        shutil.copyfileobj(fi, fo, 1 << 20)
+                        break
+                    left -= n
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+@contextlib.contextmanager
+def atomic_open(path: str, mode: str = "wb", **kw):
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, mode, **kw) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+def fadvise(fd: int, infos: list, advice: str):
+    flag = getattr(os, f"POSIX_FADV_{advice}", None)
+    if flag is None or not infos:
+        return
+    start = min(info.header_offset for info in infos)
+    end = max(info.header_offset + info.compress_size for info in infos)
+    if advice == "WILLNEED":
+        end += 1 << 16
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(fd, start, end - start, flag)
+
+
+def prefetch(items, depth: int):
+    q, stop, end = queue.Queue(maxsize=depth), threading.Event(), object()
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                q.put(item)
+        except BaseException as e:
+            q.put(e)
+        q.put(end)
+
+    threading.Thread(target=produce, daemon=True).start()
+    item = None
+    try:
+        while True:
+            item = q.get()
+            if item is end:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        while item is not end:
+            item = q.get()
+
+
+def updated_msg(updated: int, unchanged: int = 0) -> str:
+    msg = f"    {updated} image files updated\n"
+    if unchanged:
+        msg += f"    {unchanged} image files unchanged\n"
+    return msg
+
+
+DETACH = (
+    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt" else {"start_new_session": True}
+)
+
+
+def path_arg(path: str) -> str:
+    return os.path.join(".", path) if path.startswith("-") else path
+
+
+ARG_TRIMMED = re.compile(r"\s|#|-[-:\w]+#?(?:\s+[-+<]?=|[-+<]?= )")
+
+
+def argfile_text(args: list) -> str:
+    lines = []
+    for a in args:
+        if "\n" in a or "\r" in a or ARG_TRIMMED.match(a):
+            a = "#[CSTR]" + a.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+        lines.append(a)
+    return "\n".join(lines) + "\n"
+
+
+EXIFTOOL_BIN = shutil.which("exiftool")
+
+
 class ET:
+    _version_cached: Optional[str] = None
+
     def __init__(self):
-        self.bin = shutil.which("exiftool")
+        self.bin = EXIFTOOL_BIN
         if not self.bin:
             err(
                 "ExifTool not found.\n\n"
                 "  Install it first:\n"
             )
             sys.exit(1)
+        self.proc = None
+        self._daemon = True
+        self._seq = 0
+        self._errq = queue.Queue()
+        self._pool = None
 
-    def _run(self, args: list) -> str:
+    def _start(self) -> bool:
         try:
-            r = subprocess.run(
-                [self.bin] + args,
-                capture_output=True, text=True,
-                encoding="utf-8", errors="replace",
+            self.proc = subprocess.Popen(
+                [self.bin, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **DETACH,
             )
+        except OSError:
+            self._daemon = False
+            return False
+        self._errq = queue.Queue()
+        threading.Thread(target=self._drain, args=(self.proc.stderr, self._errq), daemon=True).start()
+        atexit.register(self.close)
+        return True
+
+    @staticmethod
+    def _drain(stream, errq: queue.Queue):
+        for line in stream:
+            errq.put(line)
+        errq.put(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+        self.close()
+
+    def close(self):
+        atexit.unregister(self.close)
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.write(b"-stay_open\nFalse\n")
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def _run(self, args: list) -> bytes:
+        return b"".join(self._stream(args))
+
+    def _stream(self, args: list):
+        if self.proc is None and not (self._daemon and self._start()):
+            yield from self._run_once(args).splitlines(keepends=True)
+            return
+        self._seq += 1
+        ready = f"{{ready{self._seq}}}"
+        cmd = argfile_text(["-echo4", ready] + args + [f"-execute{self._seq}"])
+        ready = ready.encode()
+        try:
+            self.proc.stdin.write(cmd.encode("utf-8"))
+            self.proc.stdin.flush()
+        except OSError:
+            self._daemon = False
+            self.close()
+            yield from self._run_once(args).splitlines(keepends=True)
+            return
+
+        seen = False
+        stdout = self.proc.stdout
+        try:
+            for line in stdout:
+                if line.rstrip(b"\r\n") == ready:
+                    break
+                seen = seen or bool(line.strip())
+                yield line
+            else:
+                self._daemon = False
+                self.close()
+                raise RuntimeError("ExifTool stopped unexpectedly")
+        except GeneratorExit:
+            for line in stdout:
+                if line.rstrip(b"\r\n") == ready:
+                    break
+            self._errors(ready)
+            raise
+
+        errors = self._errors(ready)
+        if not seen and errors:
+            raise RuntimeError(b"".join(errors).decode("utf-8", "replace").strip())
+
+    def _errors(self, ready: bytes) -> list:
+        errors = []
+        while True:
+            line = self._errq.get()
+            if line is None or line.rstrip(b"\r\n") == ready:
+                return errors
+            errors.append(line)
+
+    def _run_once(self, args: list) -> bytes:
+        try:
+            r = subprocess.run([self.bin] + args, capture_output=True)
             if r.returncode not in (0, 1):
-                raise RuntimeError(r.stderr.strip() or "ExifTool error")
+                raise RuntimeError(r.stderr.decode("utf-8", "replace").strip() or "ExifTool error")
             return r.stdout
         except FileNotFoundError:
             raise RuntimeError("ExifTool not found")
 
-    def version(self) -> str:
-        return self._run(["-ver"]).strip()
+    def _run_argfile(self, common_args: list, paths: list) -> bytes:
+        return b"".join(self._stream_argfile(common_args, paths))
 
-    def read(self, path: str) -> dict:
-        out = self._run(["-json", "-a", "-u", "-g", "--", path])
-        d = json.loads(out)
-        return d[0] if d else {}
+    def _stream_argfile(self, common_args: list, paths: list):
+        if self.proc is not None or (self._daemon and self._start()):
+            yield from self._stream(common_args + [path_arg(p) for p in paths])
+            return
+        with tempfile.NamedTemporaryFile(
+            "w", prefix="exifor_", suffix=".args", encoding="utf-8", delete=False,
+        ) as f:
+            f.write(argfile_text(common_args + [path_arg(p) for p in paths]))
+        try:
+            yield from self._stream(["-@", f.name])
+        finally:
+            os.remove(f.name)
 
-    def read_flat(self, path: str) -> dict:
-        out = self._run(["-json", "--", path])
-        d = json.loads(out)
-        return d[0] if d else {}
+    def _invalidate(self):
+        READ_CACHE.clear()
 
-    def read_tags(self, path: str, tags: list) -> dict:
-        out = self._run(["-json"] + [f"-{t}" for t in tags] + ["--", path])
-        d = json.loads(out)
-        return d[0] if d else {}
+    def _modify(self, args: list) -> str:
+        self._invalidate()
+        return self._run(args).decode("utf-8", "replace")
+
+    def _modify_many(self, args: list, paths: list) -> str:
+        self._invalidate()
+        return self._run_argfile(args + ["-P"], paths).decode("utf-8", "replace")
+
+    def strip_all_many(self, paths: list, backup: bool = False) -> str:
+        args = ["-all="]
+        if not backup:
+            args.append("-overwrite_original")
+        return self._modify_many(args, paths)
+
+    def strip_gps_many(self, paths: list, backup: bool = False) -> str:
+        args = ["-gps:all="]
+        if not backup:
+            args.append("-overwrite_original")
+        return self._modify_many(args, paths)
+
+    def write_many(self, paths: list, tags: dict, backup: bool = False) -> str:
+        args = list(tag_argv(tuple(tags.items())))
+        if not backup:
+            args.append("-overwrite_original")
+        return self._modify_many(args, paths)
+
+    def pool(self, n: int = 0) -> "ETPool":
+        n = n or min(DIR_WORKERS, os.cpu_count() or 1)
+        if self._pool is None:
+            self._pool = ETPool(self, n)
+        else:
+            self._pool.grow(n)
+        return self._pool
+
+    def _parallel(self, op: str, paths: list, *args, workers: int = ZIP_WORKERS, chunk: int = ZIP_CHUNK):
+        if not paths:
+            return
+        n = min(os.cpu_count() or 1, workers)
+        size = max(1, min(chunk, -(-len(paths) // n)))
+        chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+        if len(chunks) == 1:
+            yield chunks[0], getattr(self, op)(chunks[0], *args)
+            return
+        yield from self._pipeline(op, chunks, *args, workers=min(n, len(chunks)))
+
+    def _pipeline(self, op: str, chunks, *args, workers: int = ZIP_WORKERS):
+        pool = self.pool(workers)
+        pending = {}
+        try:
+            for c in chunks:
+                pending[pool.submit(op, c, *args)] = c
+                for fut in [f for f in pending if f.done()]:
+                    yield pending.pop(fut), fut.result()
+            for fut in as_completed(list(pending)):
+                yield pending.pop(fut), fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+            wait(pending)
+
+    def version(self) -> str:
+        if ET._version_cached is None:
+            ET._version_cached = self._run(["-ver"]).decode().strip()
+        return ET._version_cached
+
+    @staticmethod
+    def _fast(fast: int) -> list:
+        fast = min(fast, FAST_MAX)
+        if fast >= 2:
+            return ["-fast2"]
+        if fast == 1:
+            return ["-fast"]
+        return []
+
+    def read(self, path: str, fast: int = 0) -> dict:
+        return self._read_stat(path, ("-a", "-u", "-g", *self._fast(fast)))
+
+    def read_flat(self, path: str, fast: int = 2) -> dict:
+        return self._read_stat(path, tuple(self._fast(fast)))
+
+    def read_tags(self, path: str, tags: list, fast: int = 2, numeric: bool = False) -> dict:
+        args = self._fast(fast) + (["-n"] if numeric else []) + [f"-{t}" for t in tags]
+        return self._read_stat(path, tuple(args))
+
+    def _read_stat(self, path: str, args: tuple) -> dict:
+        path = os.path.realpath(path)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size, args)
+        data = READ_CACHE.get(key)
+        if data is None:
+            d = _loads(self._run(["-json"] + list(args) + [path_arg(path)]))
+            data = d[0] if d else {}
+        return dict(cache_put(READ_CACHE, key, data, READ_CACHE_SIZE))
 
     def write(self, path: str, tags: dict, backup: bool = False) -> str:
-        args = [f"-{k}={v}" for k, v in tags.items()]
+        args = list(tag_argv(tuple(tags.items())))
         if not backup:
             args.append("-overwrite_original")
-        return self._run(args + ["--", path])
+        return self._modify(args + [path_arg(path)])
 
     def strip_all(self, path: str, backup: bool = False) -> str:
         args = ["-all="]
         if not backup:
             args.append("-overwrite_original")
-        return self._run(args + ["--", path])
+        return self._modify(args + [path_arg(path)])
 
     def strip_all_to(self, src: str, dst: str) -> str:
-        shutil.copy2(src, dst)
-        return self._run(["-all=", "-overwrite_original", "--", dst])
+        return self._modify_to(["-all="], src, dst)
+
+    def _modify_to(self, args: list, src: str, dst: str) -> str:
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return self._modify(args + ["-overwrite_original", path_arg(src)])
+        head, tail = os.path.split(dst)
+        root, ext = os.path.splitext(tail)
+        tmp = os.path.join(head, f".{root}.exifor{os.getpid()}{ext}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        try:
+            out = self._modify(args + ["-o", path_arg(tmp), path_arg(src)])
+            if os.path.exists(tmp):
+                os.replace(tmp, dst)
+            return out
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
 
     def strip_gps(self, path: str, backup: bool = False) -> str:
+        if ext_of(path) in NATIVE_GPS:
+            done = self._strip_gps_jpeg_native(path, backup)
+            if done is not None:
+                return updated_msg(int(done), int(not done))
         args = ["-gps:all="]
         if not backup:
             args.append("-overwrite_original")
-        return self._run(args + ["--", path])
+        return self._modify(args + [path_arg(path)])
 
     def strip_gps_to(self, src: str, dst: str) -> str:
-        shutil.copy2(src, dst)
-        return self._run(["-gps:all=", "-overwrite_original", "--", dst])
+        if ext_of(src) not in NATIVE_GPS:
+            return self._modify_to(["-gps:all="], src, dst)
+        if not (os.path.exists(dst) and os.path.samefile(src, dst)):
+            fast_copy(src, dst)
+        return self.strip_gps(dst)
+
+    def _strip_gps_jpeg_native(self, path: str, backup: bool = False, preserve: bool = False) -> Optional[bool]:
+        try:
+            st = os.stat(path)
+            with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+                span = jpeg_exif_span(mm)
+                if span is None:
+                    return None
+                start, end = span
+                seg = bytearray(mm[start:end])
+                found = tiff_drop_gps(seg)
+                if not found:
+                    return found
+                if backup and not os.path.exists(path + "_original"):
+                    fast_copy(path, path + "_original")
+                mm[start:end] = seg
+                mm.flush()
+                if not backup:
+                    os.fsync(f.fileno())
+            if preserve:
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        except (OSError, ValueError, struct.error):
+            return None
+        self._invalidate()
+        return True
 
     def strip_tag(self, path: str, tag: str, backup: bool = False) -> str:
         args = [f"-{tag}="]
         if not backup:
             args.append("-overwrite_original")
-        return self._run(args + ["--", path])
+        return self._modify(args + [path_arg(path)])
 
     def strip_tag_to(self, src: str, dst: str, tag: str) -> str:
-        shutil.copy2(src, dst)
-        return self._run([f"-{tag}=", "-overwrite_original", "--", dst])
+        return self._modify_to([f"-{tag}="], src, dst)
 
     def read_gps(self, path: str) -> dict:
         return self.read_tags(path, [
             "GPSLatitude", "GPSLongitude", "GPSAltitude",
             "GPSLatitudeRef", "GPSLongitudeRef", "GPSAltitudeRef",
             "GPSSpeed", "GPSDateStamp", "GPSTimeStamp",
-        ])
+        ], fast=2, numeric=True)
 
     def write_gps(self, path: str, lat: float, lon: float, alt: Optional[float] = None, backup: bool = False):
-        tags = {
-            "GPSLatitude": str(abs(lat)),
-            "GPSLatitudeRef": "N" if lat >= 0 else "S",
-            "GPSLongitude": str(abs(lon)),
-            "GPSLongitudeRef": "E" if lon >= 0 else "W",
-        }
-        if alt is not None:
-            tags["GPSAltitude"] = str(abs(alt))
-            tags["GPSAltitudeRef"] = "0" if alt >= 0 else "1"
-        self.write(path, tags, backup)
-
-    def strip_dir(self, directory: str, exts: Optional[list], backup: bool = False) -> str:
-        args = ["-all="]
-        if exts:
-            for e in exts:
-                args += ["-ext", e]
-        if not backup:
-            args.append("-overwrite_original")
-        return self._run(args + ["-r", "--", directory])
-
-    def strip_gps_dir(self, directory: str, exts: Optional[list], backup: bool = False) -> str:
-        args = ["-gps:all="]
-        if exts:
-            for e in exts:
-                args += ["-ext", e]
-        if not backup:
-            args.append("-overwrite_original")
-        return self._run(args + ["-r", "--", directory])
-
-    def write_dir(self, directory: str, tags: dict, exts: Optional[list], backup: bool = False) -> str:
-        args = [f"-{k}={v}" for k, v in tags.items()]
-        if exts:
-            for e in exts:
-                args += ["-ext", e]
-        if not backup:
-            args.append("-overwrite_original")
-        return self._run(args + ["-r", "--", directory])
+        self.write(path, gps_tags(lat, lon, alt), backup)
+
+    def strip_dir(
+        self, directory: str, exts: Optional[frozenset], backup: bool = False, workers: int = 0, progress=None,
+    ) -> str:
+        return self._dir_op("strip_all_many", directory, exts, backup, workers=workers, progress=progress)
+
+    def strip_gps_dir(
+        self, directory: str, exts: Optional[frozenset], backup: bool = False, workers: int = 0, progress=None,
+    ) -> str:
+        paths = list(iter_files(directory, exts))
+        if not paths:
+            return "No matching files found"
+        rest, done, unchanged = [], 0, 0
+        for p in paths:
+            found = self._strip_gps_jpeg_native(p, backup, preserve=True) if ext_of(p) in NATIVE_GPS else None
+            if found is None:
+                rest.append(p)
+            elif found:
+                done += 1
+            else:
+                unchanged += 1
+        outs = [updated_msg(done, unchanged)] if done or unchanged else []
+        finished = done + unchanged
+        if progress and finished:
+            progress(finished, len(paths))
+        for chunk, out in self._parallel("strip_gps_many", rest, backup, workers=workers or DIR_WORKERS, chunk=DIR_CHUNK):
+            outs.append(out)
+            finished += len(chunk)
+            if progress:
+                progress(finished, len(paths))
+        return summarize(outs)
+
+    def write_dir(
+        self, directory: str, tags: dict, exts: Optional[frozenset], backup: bool = False, workers: int = 0,
+        progress=None,
+    ) -> str:
+        return self._dir_op("write_many", directory, exts, tags, backup, workers=workers, progress=progress)
+
+    def _dir_op(
+        self, op: str, directory: str, exts: Optional[frozenset], *args, workers: int = 0, progress=None,
+    ) -> str:
+        paths = list(iter_files(directory, exts))
+        if not paths:
+            return "No matching files found"
+        outs, done = [], 0
+        for chunk, out in self._parallel(op, paths, *args, workers=workers or DIR_WORKERS, chunk=DIR_CHUNK):
+            outs.append(out)
+            done += len(chunk)
+            if progress:
+                progress(done, len(paths))
+        return summarize(outs)
 
     def copy_from(self, src: str, dst: str, backup: bool = False):
-        args = ["-TagsFromFile", src]
+        args = ["-TagsFromFile", path_arg(src), "-all:all"]
         if not backup:
             args.append("-overwrite_original")
-        self._run(args + ["--", dst])
+        self._modify(args + [path_arg(dst)])
 
     def export_json(self, path: str, out: str):
-        data = self.read(path)
-        with open(out, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        lines = self._stream(["-json", "-a", "-u", "-g", path_arg(path)])
+        with atomic_open(out, "wb", buffering=1 << 20) as f:
+            prev = next(lines, b"[{}]\n").lstrip(b"[")
+            for line in lines:
+                f.write(prev)
+                prev = line
+            f.write(prev.rstrip().rstrip(b"]") + b"\n")
 
     def export_csv(self, path: str, out: str):
         import csv
-        data = self.read(path)
-        rows = []
-        for grp, vals in data.items():
-            if isinstance(vals, dict):
-                for k, v in vals.items():
-                    rows.append({"Group": grp, "Tag": k, "Value": str(v)})
-            else:
-                rows.append({"Group": "", "Tag": grp, "Value": str(vals)})
-        with open(out, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=["Group", "Tag", "Value"])
-            w.writeheader()
-            w.writerows(rows)
-
-    def strip_zip(self, zip_in: str, zip_out: str) -> int:
-        tmpdir = tempfile.mkdtemp(prefix="exifor_")
+
+        def rows():
+            yield "", "SourceFile", path
+            for line in self._stream(["-args", "-G", "-a", "-u", path_arg(path)]):
+                line = line.decode("utf-8", "replace").rstrip("\r\n")
+                tag, _, val = line[1:].partition("=")
+                grp, _, name = tag.rpartition(":")
+                yield grp, name, val
+
+        with atomic_open(out, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            w = csv.writer(f)
+            w.writerow(("Group", "Tag", "Value"))
+            w.writerows(rows())
+
+    def strip_zip(self, zip_in: str, zip_out: str, workers: int = ZIP_WORKERS, progress=None) -> int:
+        with open(zip_in, "rb") as raw, zipfile.ZipFile(raw, "r") as zf:
+            infos = [info for info in zf.infolist() if not info.is_dir()]
+            if progress:
+                progress(0, len(infos))
+            tmpdir = scratch_dir(sum(info.file_size for info in infos))
+            n = max(1, min(os.cpu_count() or 1, workers))
+            size = max(1, min(ZIP_CHUNK, -(-len(infos) // n)))
+            members, count = {}, 0
+
+            def extract():
+                fadvise(raw.fileno(), infos[:size], "WILLNEED")
+                for i in range(0, len(infos), size):
+                    fadvise(raw.fileno(), infos[i + size:i + 2 * size], "WILLNEED")
+                    chunk = {zf.extract(info, tmpdir): info for info in infos[i:i + size]}
+                    fadvise(raw.fileno(), infos[i:i + size], "DONTNEED")
+                    yield chunk
+
+            def staged():
+                for chunk in prefetch(extract(), ZIP_PREFETCH):
+                    members.update(chunk)
+                    yield list(chunk)
+
+            stream = staged()
+            done = self._pipeline("strip_all_many", stream, workers=n)
+            try:
+                with zipfile.ZipFile(zip_out, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_LEVEL) as zf_out:
+                    for chunk, _ in done:
+                        for fpath in chunk:
+                            info = members.pop(fpath)
+                            if ext_of(info.filename) in PRECOMPRESSED:
+                                ct = zipfile.ZIP_STORED
+                            else:
+                                ct = info.compress_type
+                            zf_out.write(fpath, info.filename, compress_type=ct)
+                            count += 1
+                        if progress:
+                            progress(count, len(infos))
+                return count
+            finally:
+                done.close()
+                stream.close()
+                shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def _read_members(self, infos: list, zip_in: str) -> list:
+        header_only = HEADER_ONLY if FAST_MAX >= 2 else frozenset()
+        tmpdir = scratch_dir(sum(
+            min(info.file_size, HEADER_BYTES) if ext_of(info.filename) in header_only else info.file_size
+            for info in infos
+        ))
         try:
+            results, names = [], {}
             with zipfile.ZipFile(zip_in, "r") as zf:
-                zf.extractall(tmpdir)
-            self._run(["-all=", "-overwrite_original", "-r", "--", tmpdir])
-            count = 0
-            with zipfile.ZipFile(zip_out, "w", zipfile.ZIP_DEFLATED) as zf_out:
-                for root, _, files in os.walk(tmpdir):
-                    for fname in files:
-                        fpath = os.path.join(root, fname)
-                        arcname = os.path.relpath(fpath, tmpdir)
-                        zf_out.write(fpath, arcname)
-                        count += 1
-            return count
+                for i, info in enumerate(infos):
+                    ext = ext_of(info.filename)
+                    with zf.open(info) as src:
+                        head = src.read(HEADER_BYTES)
+                        found = fast_tag_count(head) if ext in FAST_COUNT and FAST_MAX >= 2 else None
+                        if found is not None:
+                            results.append({"file": info.filename, "tags": found})
+                            continue
+                        dst = os.path.join(tmpdir, f"{i}{ext}")
+                        with open(dst, "wb") as f:
+                            f.write(head)
+                            if ext not in header_only:
+                                shutil.copyfileobj(src, f, 1 << 20)
+                    names[dst] = info.filename
+            if not names:
+                return results
+            counts = dict.fromkeys(names, 0)
+            current = next(iter(names)) if len(names) == 1 else None
+            args = [
+                "-s", "-a", "-u", "-e", *self._fast(2),
+                "--ExifTool:all", "--File:all", "--System:all", *LAYOUT_TAGS,
+            ]
+            for line in self._stream_argfile(args, list(names)):
+                if line.startswith(b"======== "):
+                    current = line[9:].rstrip(b"\r\n").decode("utf-8", "replace")
+                elif current in counts and line[:1] not in (b" ", b"\r", b"\n", b""):
+                    counts[current] += 1
+            return results + [{"file": names[p], "tags": n} for p, n in counts.items()]
         finally:
             shutil.rmtree(tmpdir, ignore_errors=True)
 
     def list_zip_metadata(self, zip_in: str) -> list:
-        tmpdir = tempfile.mkdtemp(prefix="exifor_")
-        try:
-            with zipfile.ZipFile(zip_in, "r") as zf:
-                zf.extractall(tmpdir)
-            out = self._run(["-json", "-a", "-u", "-r", "--", tmpdir])
-            if not out.strip():
-                return []
-            items = json.loads(out)
+        path = os.path.realpath(zip_in)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        rows = ZIP_META.get(key)
+        if rows is None:
+            with zipfile.ZipFile(path, "r") as zf:
+                infos = [info for info in zf.infolist() if not info.is_dir()]
             results = []
-            for item in items:
-                src = item.get("SourceFile", "")
-                tag_count = sum(
-                    len(v) if isinstance(v, dict) else 1
-                    for k, v in item.items()
-                    if k not in ("SourceFile", "ExifToolVersion", "File")
-                )
-                rel = os.path.relpath(src, tmpdir)
-                results.append({"file": rel, "tags": tag_count})
-            return results
+            for _, items in self._parallel("_read_members", infos, path):
+                results.extend(items)
+            results.sort(key=lambda r: r["file"])
+            rows = tuple((r["file"], r["tags"]) for r in results)
+        cache_put(ZIP_META, key, rows, ZIP_META_SIZE)
+        return [{"file": f, "tags": n} for f, n in rows]
+
+
+class ETPool:
+    def __init__(self, owner: ET, n: int):
+        self.workers = [owner] + [ET() for _ in range(max(n, 1) - 1)]
+        self._idle = queue.Queue()
+        for w in self.workers:
+            self._idle.put(w)
+        self._ex = ThreadPoolExecutor(max_workers=len(self.workers))
+
+    def grow(self, n: int):
+        if n <= len(self.workers):
+            return
+        for _ in range(n - len(self.workers)):
+            w = ET()
+            self.workers.append(w)
+            self._idle.put(w)
+        old, self._ex = self._ex, ThreadPoolExecutor(max_workers=len(self.workers))
+        old.shutdown()
+
+    def _call(self, op: str, *args):
+        w = self._idle.get()
+        try:
+            return getattr(w, op)(*args)
         finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
+            self._idle.put(w)
+
+    def submit(self, op: str, *args):
+        return self._ex.submit(self._call, op, *args)
+
+    def close(self):
+        self._ex.shutdown()
+        for w in self.workers[1:]:
+            w.close()
+
+
+@functools.lru_cache(maxsize=32)
+def browse_rows(cwd: str, mtime: int) -> tuple:
+    with os.scandir(cwd) as it:
+        entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
+
+    dirs, media, other = [], [], []
+    for e in entries:
+        if e.is_dir():
+            if not e.name.startswith("."):
+                dirs.append(e)
+        elif e.is_file():
+            ext = ext_of(e.name)
+            if ext in MEDIA:
+                media.append((e, Y if ext == ".zip" else G))
+            else:
+                other.append(e)
+
+    rows = []
+    rows.append((f"[{D}]../  go up[/]", "up", os.path.dirname(cwd)))
+
+    for d in dirs:
+        rows.append((f"[{A}]{escape(d.name)}/[/]", "dir", d.path))
+
+    for f, color in media:
+        rows.append((f"[{color}]{escape(f.name)}[/]  [{D}]{entry_sz(f)}[/]", "file", f.path))
+
+    for f in other:
+        rows.append((f"[{D}]{escape(f.name)}  {entry_sz(f)}[/]", "file", f.path))
+    return tuple(rows)
 
 
 def browse(want_dir: bool = False, title: str = "Select a file") -> Optional[str]:
@@ -356,31 +1325,12 @@ def browse(want_dir: bool = False, title: str = "Select a file") -> Optional[str
         header(title, cwd)
 
         try:
-            entries_raw = sorted(os.scandir(cwd), key=lambda e: (not e.is_dir(), e.name.lower()))
+            rows = browse_rows(cwd, os.stat(cwd).st_mtime_ns)
         except PermissionError:
             err("Permission denied for this folder")
             cwd = os.path.dirname(cwd)
             continue
 
-        dirs  = [e for e in entries_raw if e.is_dir() and not e.name.startswith(".")]
-        files = [e for e in entries_raw if e.is_file()]
-        media = [e for e in files if os.path.splitext(e.name)[1].lower() in MEDIA]
-        other = [e for e in files if e not in media]
-
-        rows = []
-        rows.append((f"[{D}]../  go up[/]", "up", os.path.dirname(cwd)))
-
-        for d in dirs:
-            rows.append((f"[{A}]{escape(d.name)}/[/]", "dir", d.path))
-
-        for f in media:
-            ext = os.path.splitext(f.name)[1].lower()
-            color = Y if ext == ".zip" else G
-            rows.append((f"[{color}]{escape(f.name)}[/]  [{D}]{sz(f.path)}[/]", "file", f.path))
-
-        for f in other:
-            rows.append((f"[{D}]{escape(f.name)}  {sz(f.path)}[/]", "file", f.path))
-
         for i, (label, kind, path) in enumerate(rows, 1):
             prefix = f"[{D}]{i:2}[/]"
             C.print(f"  {prefix}  {label}")
@@ -447,7 +1397,7 @@ def choose_output_path(src: str, suffix: str = "_clean") -> Optional[str]:
     C.print(f"  [{D}]0[/]  Cancel")
     rule()
     C.print(f"  [{A}]→[/]  ", end="")
-    raw = input().strip()
+    raw = getch()
 
     if raw == "0":
         return None
@@ -473,35 +1423,42 @@ def act_view(et: ET):
     if not path:
         return
 
-    header("Metadata", os.path.basename(path))
-    with spin("Reading tags...") as p:
-        p.add_task("", total=None)
-        try:
-            data = et.read(path)
-        except Exception as e:
-            err(str(e)); pause(); return
+    fast = FAST_MAX
+    while True:
+        header("Metadata", os.path.basename(path) + ("  (quick scan)" if fast else ""))
+        with spin("Reading tags..."):
+            try:
+                data = et.read(path, fast=fast)
+            except Exception as e:
+                err(str(e)); pause(); return
 
-    if not data:
-        warn("No metadata found in this file"); pause(); return
+        found = False
+        for group, vals in data.items():
+            if group in ("SourceFile", "ExifToolVersion"):
+                continue
+            if isinstance(vals, dict) and vals:
+                found = True
+                t = tag_table()
+                for k, v in vals.items():
+                    s = str(v)
+                    display = s[:160] + "…" if len(s) > 160 else s
+                    t.add_row(escape(k), escape(display))
+                C.print(Panel(t, title=f"[bold {Y}]{escape(group)}[/]", border_style=D, padding=(0, 1)))
 
-    found = False
-    for group, vals in data.items():
-        if group in ("SourceFile", "ExifToolVersion"):
-            continue
-        if isinstance(vals, dict) and vals:
-            found = True
-            t = Table(show_header=False, box=box.SIMPLE, padding=(0, 1), expand=True)
-            t.add_column("Tag",   style=f"bold {W}", min_width=26)
-            t.add_column("Value", style=W, overflow="fold")
-            for k, v in vals.items():
-                s = str(v)
-                display = s[:160] + "…" if len(s) > 160 else s
-                t.add_row(escape(k), escape(display))
-            C.print(Panel(t, title=f"[bold {Y}]{escape(group)}[/]", border_style=D, padding=(0, 1)))
-
-    if not found:
-        warn("No tags found")
-    pause()
+        if not data:
+            warn("No metadata found in this file")
+        elif not found:
+            warn("No tags found")
+
+        if not fast or NONINTERACTIVE:
+            pause()
+            return
+
+        C.print(f"  [{D}]f[/]  Full scan  [{D}](MakerNotes, trailers — slower)[/]")
+        C.print(f"  [{D}]Enter to continue...[/]", end="")
+        if getch().lower() != "f":
+            return
+        fast = 0
 
 
 def act_strip(et: ET):
@@ -517,7 +1474,7 @@ def act_strip(et: ET):
         C.print(f"  [{D}]0[/]  Back to main menu")
         rule()
         C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip()
+        raw = getch()
 
         if raw == "0":
             return
@@ -542,8 +1499,7 @@ def act_strip(et: ET):
             if raw == "1":
                 if not yesno("Remove ALL tags from this file? This cannot be undone.", default=False):
                     warn("Cancelled"); pause(); continue
-                with spin("Removing all metadata...") as p:
-                    p.add_task("", total=None)
+                with spin("Removing all metadata..."):
                     if save_as_copy:
                         et.strip_all_to(path, out_path)
                     else:
@@ -551,8 +1507,7 @@ def act_strip(et: ET):
                 show_result(True, "Remove all metadata", path, out_path, backup_path)
 
             elif raw == "2":
-                with spin("Removing GPS...") as p:
-                    p.add_task("", total=None)
+                with spin("Removing GPS..."):
                     if save_as_copy:
                         et.strip_gps_to(path, out_path)
                     else:
@@ -563,8 +1518,7 @@ def act_strip(et: ET):
                 tag = ask("Tag name to remove  (e.g. Comment, Artist, Software)")
                 if not tag:
                     warn("No tag specified — cancelled"); pause(); continue
-                with spin(f"Removing {tag}...") as p:
-                    p.add_task("", total=None)
+                with spin(f"Removing {tag}..."):
                     if save_as_copy:
                         et.strip_tag_to(path, out_path, tag)
                     else:
@@ -591,14 +1545,13 @@ def act_gps(et: ET):
         C.print(f"  [{D}]0[/]  Back to main menu")
         rule()
         C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip()
+        raw = getch()
 
         if raw == "0":
             return
 
         if raw == "1":
-            with spin("Reading GPS...") as p:
-                p.add_task("", total=None)
+            with spin("Reading GPS..."):
                 try:
                     gps = et.read_gps(path)
                 except Exception as e:
@@ -610,6 +1563,7 @@ def act_gps(et: ET):
             lat_ref = gps.get("GPSLatitudeRef", "")
             lon_ref = gps.get("GPSLongitudeRef","")
             alt     = gps.get("GPSAltitude",    "—")
+            alt_ref = gps.get("GPSAltitudeRef", 0)
             speed   = gps.get("GPSSpeed",       "—")
             gdate   = gps.get("GPSDateStamp",   "—")
             gtime   = gps.get("GPSTimeStamp",   "—")
@@ -617,22 +1571,22 @@ def act_gps(et: ET):
             if lat == "—" and lon == "—":
                 warn("No GPS data found in this file")
             else:
-                t = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
-                t.add_column("", style=D, min_width=16)
-                t.add_column("", style=W)
-                t.add_row("Latitude",   escape(f"{lat} {lat_ref}"))
-                t.add_row("Longitude",  escape(f"{lon} {lon_ref}"))
+                if isinstance(lat, (int, float)) and lat_ref:
+                    lat = abs(lat) * (-1 if lat_ref == "S" else 1)
+                if isinstance(lon, (int, float)) and lon_ref:
+                    lon = abs(lon) * (-1 if lon_ref == "W" else 1)
+                if isinstance(alt, (int, float)):
+                    alt = f"{-abs(alt) if str(alt_ref) == '1' else alt} m"
+                t = gps_table()
+                t.add_row("Latitude",   escape(str(lat)))
+                t.add_row("Longitude",  escape(str(lon)))
                 t.add_row("Altitude",   escape(str(alt)))
                 t.add_row("Speed",      escape(str(speed)))
                 t.add_row("GPS Date",   escape(str(gdate)))
                 t.add_row("GPS Time",   escape(str(gtime)))
                 C.print(Panel(t, border_style=D, padding=(1, 2)))
-                try:
-                    lat_f = float(str(lat).split()[0]) * (-1 if lat_ref == "S" else 1)
-                    lon_f = float(str(lon).split()[0]) * (-1 if lon_ref == "W" else 1)
-                    C.print(f"\n  [{D}]Google Maps[/]  [{A}]https://maps.google.com/?q={lat_f},{lon_f}[/]")
-                except Exception:
-                    pass
+                if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
+                    C.print(f"\n  [{D}]Google Maps[/]  [{A}]https://maps.google.com/?q={lat},{lon}[/]")
             pause()
 
         elif raw == "2":
@@ -653,8 +1607,7 @@ def act_gps(et: ET):
                 alt_f = float(alt_s) if alt_s else None
                 keep_backup = yesno("Keep a backup of the original?", default=False)
                 backup_path = path + "_original" if keep_backup else None
-                with spin("Writing GPS...") as p:
-                    p.add_task("", total=None)
+                with spin("Writing GPS..."):
                     et.write_gps(path, lat_f, lon_f, alt_f, keep_backup)
                 extra = f"{lat_f}, {lon_f}" + (f"  alt {alt_f} m" if alt_f is not None else "")
                 show_result(True, "Write GPS coordinates", path, path, backup_path, extra)
@@ -666,8 +1619,7 @@ def act_gps(et: ET):
             keep_backup = yesno("Keep a backup of the original?", default=False)
             backup_path = path + "_original" if keep_backup else None
             try:
-                with spin("Removing GPS...") as p:
-                    p.add_task("", total=None)
+                with spin("Removing GPS..."):
                     et.strip_gps(path, keep_backup)
                 show_result(True, "Remove GPS data", path, path, backup_path)
             except Exception as e:
@@ -695,6 +1647,24 @@ POPULAR_TAGS = [
     ("Rating",           "Rating  (0–5)"),
 ]
 
+POPULAR_TAG_NAMES = tuple(tag for tag, _ in POPULAR_TAGS)
+POPULAR_TAG_SET = frozenset(POPULAR_TAG_NAMES)
+
+
+def edit_table() -> Table:
+    t = Table(
+        show_header=True,
+        header_style=f"bold {A}",
+        box=box.SIMPLE_HEAD,
+        padding=(0, 2),
+        expand=True,
+    )
+    t.add_column("#",           style=f"bold {D}", width=4)
+    t.add_column("Tag",         style=f"bold {W}", min_width=20)
+    t.add_column("Description", style=D, min_width=20)
+    t.add_column("Current",     style=Y, overflow="fold")
+    return t
+
 
 def act_edit(et: ET):
     path = browse(title="Edit Tags  —  select a file")
@@ -704,21 +1674,11 @@ def act_edit(et: ET):
     while True:
         header("Edit Tags", os.path.basename(path))
         try:
-            cur = et.read_flat(path)
+            cur = et.read_tags(path, POPULAR_TAG_NAMES)
         except Exception:
             cur = {}
 
-        t = Table(
-            show_header=True,
-            header_style=f"bold {A}",
-            box=box.SIMPLE_HEAD,
-            padding=(0, 2),
-            expand=True,
-        )
-        t.add_column("#",           style=f"bold {D}", width=4)
-        t.add_column("Tag",         style=f"bold {W}", min_width=20)
-        t.add_column("Description", style=D, min_width=20)
-        t.add_column("Current",     style=Y, overflow="fold")
+        t = edit_table()
 
         for i, (tag, desc) in enumerate(POPULAR_TAGS, 1):
             v = str(cur.get(tag, ""))
@@ -740,6 +1700,11 @@ def act_edit(et: ET):
             tag = ask("Tag name  (e.g. XMP:Description, IPTC:Keywords)").strip()
             if not tag:
                 continue
+            if tag not in POPULAR_TAG_SET:
+                try:
+                    cur = {tag: v for k, v in et.read_tags(path, [tag]).items() if k != "SourceFile"}
+                except Exception:
+                    cur = {}
         elif raw == "m":
             _edit_multi(et, path)
             continue
@@ -761,8 +1726,7 @@ def act_edit(et: ET):
         keep_backup = yesno("Keep a backup of the original?", default=False)
         backup_path = path + "_original" if keep_backup else None
         try:
-            with spin("Writing...") as p:
-                p.add_task("", total=None)
+            with spin("Writing..."):
                 et.write(path, {tag: val}, keep_backup)
             show_result(True, f"Write tag: {tag} = {val}", path, path, backup_path)
         except Exception as e:
@@ -788,8 +1752,7 @@ def _edit_multi(et: ET, path: str):
     keep_backup = yesno("Keep a backup of the original?", default=False)
     backup_path = path + "_original" if keep_backup else None
     try:
-        with spin("Writing...") as p:
-            p.add_task("", total=None)
+        with spin("Writing..."):
             et.write(path, tags, keep_backup)
         show_result(True, f"Write {len(tags)} tag(s)", path, path, backup_path)
     except Exception as e:
@@ -812,7 +1775,7 @@ def act_zip(et: ET):
         C.print(f"  [{D}]0[/]  Back to main menu")
         rule()
         C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip()
+        raw = getch()
 
         if raw == "0":
             return
@@ -831,8 +1794,7 @@ def act_zip(et: ET):
 
         if raw == "2":
             header("ZIP: Inspect MetaData", os.path.basename(path))
-            with spin("Analysing ZIP contents...") as p:
-                p.add_task("", total=None)
+            with spin("Analysing ZIP contents..."):
                 try:
                     results = et.list_zip_metadata(path)
                 except Exception as e:
@@ -841,19 +1803,8 @@ def act_zip(et: ET):
             if not results:
                 ok("No metadata found — archive is clean")
             else:
-                t = Table(show_header=True, header_style=f"bold {A}", box=box.SIMPLE_HEAD, padding=(0, 2))
-                t.add_column("File",       style=W, overflow="fold")
-                t.add_column("Tags found", style=Y, justify="right")
-                total_tags = 0
-                dirty = 0
-                for item in results:
-                    count = item["tags"]
-                    total_tags += count
-                    if count > 0:
-                        dirty += 1
-                    color = R if count > 0 else G
-                    t.add_row(escape(item["file"]), f"[{color}]{count}[/]")
-                C.print(Panel(t, border_style=D, padding=(0, 1)))
+                panel, dirty, total_tags = zip_panel(tuple((item["file"], item["tags"]) for item in results))
+                C.print(panel)
                 if dirty:
                     C.print(f"\n  [{R}]{dirty} file(s) contain metadata[/]  [{D}](total {total_tags} tags)[/]")
                 else:
@@ -865,16 +1816,24 @@ def act_zip(et: ET):
             header("ZIP Clean", os.path.basename(path))
 
             try:
-                with zipfile.ZipFile(path, "r") as zf:
-                    file_list = [n for n in zf.namelist() if not n.endswith("/")]
-                    file_count = len(file_list)
+                file_list, key = scan_zip(path)
             except Exception as e:
                 err(f"Could not open ZIP: {e}"); pause(); continue
 
             C.print(f"  [{D}]Archive:[/]   {escape(os.path.basename(path))}")
-            C.print(f"  [{D}]Files:  [/]   {file_count}")
+            C.print(f"  [{D}]Files:  [/]   {len(file_list)}")
             C.print(f"  [{D}]Size:   [/]   {sz(path)}")
 
+            done = zip_cleaned(key)
+            if done:
+                C.print()
+                if done == key[0]:
+                    ok("Archive already clean (cached)")
+                else:
+                    ok(f"Archive already clean (cached)  →  {escape(done)}")
+                pause()
+                continue
+
             base = os.path.splitext(path)[0]
             out_default = base + "_clean.zip"
             C.print()
@@ -892,13 +1851,15 @@ def act_zip(et: ET):
                     warn("Cancelled"); continue
 
             C.print()
-            with spin("Stripping metadata and repacking...") as p:
-                p.add_task("", total=None)
+            with spin("Stripping metadata and repacking...") as progress:
                 try:
-                    processed = et.strip_zip(path, out_path)
+                    processed = et.strip_zip(path, out_path, progress=progress)
                 except Exception as e:
                     show_result(False, "ZIP clean", path, out_path, None, str(e))
                     pause(); continue
+            with contextlib.suppress(OSError, zipfile.BadZipFile):
+                out_key = scan_zip(out_path)[1]
+                ZIP_CLEAN[key] = ZIP_CLEAN[out_key] = out_key[0]
 
             show_result(
                 True,
@@ -921,7 +1882,7 @@ def act_folder(et: ET):
         C.print(f"  [{D}]0[/]  Back to main menu")
         rule()
         C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip()
+        raw = getch()
 
         if raw == "0":
             return
@@ -933,23 +1894,21 @@ def act_folder(et: ET):
         if not folder:
             continue
 
-        ext_s = ask("File extensions to include  (e.g. jpg,png — or Enter for all files)", "")
-        exts  = [e for e in (e.strip().lower() for e in ext_s.split(",")) if e] if ext_s.strip() else None
+        ext_s = ask("File extensions to include  (e.g. jpg,png — or Enter for all media files)", "")
+        exts  = ext_set([e for e in (e.strip() for e in ext_s.split(",")) if e])
         keep_backup = yesno("Keep backup copies of originals?", default=False)
 
         try:
             if raw == "1":
                 if not yesno("Remove ALL MetaData from ALL files in this folder?", default=False):
                     warn("Cancelled"); continue
-                with spin("Processing folder...") as p:
-                    p.add_task("", total=None)
-                    out = et.strip_dir(folder, exts, keep_backup)
+                with spin("Processing folder...") as progress:
+                    out = et.strip_dir(folder, exts, keep_backup, progress=progress)
                 show_result(True, "Remove all metadata (folder)", folder, folder, None, out.strip() or "Done")
 
             elif raw == "2":
-                with spin("Removing GPS...") as p:
-                    p.add_task("", total=None)
-                    out = et.strip_gps_dir(folder, exts, keep_backup)
+                with spin("Removing GPS...") as progress:
+                    out = et.strip_gps_dir(folder, exts, keep_backup, progress=progress)
                 show_result(True, "Remove GPS (folder)", folder, folder, None, out.strip() or "Done")
 
             elif raw == "3":
@@ -966,9 +1925,8 @@ def act_folder(et: ET):
                     warn("No tags entered — cancelled"); continue
                 if not yesno(f"Write {len(tags)} tag(s) to all files in folder?", default=False):
                     warn("Cancelled"); continue
-                with spin("Writing...") as p:
-                    p.add_task("", total=None)
-                    out = et.write_dir(folder, tags, exts, keep_backup)
+                with spin("Writing...") as progress:
+                    out = et.write_dir(folder, tags, exts, keep_backup, progress=progress)
                 show_result(True, f"Write {len(tags)} tag(s) (folder)", folder, folder, None, out.strip() or "Done")
 
         except Exception as e:
@@ -989,7 +1947,7 @@ def act_export(et: ET):
         C.print(f"  [{D}]0[/]  Back to main menu")
         rule()
         C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip()
+        raw = getch()
 
         if raw == "0":
             return
@@ -1006,8 +1964,7 @@ def act_export(et: ET):
 
         out = os.path.expanduser(out)
 
-        with spin("Exporting...") as p:
-            p.add_task("", total=None)
+        with spin("Exporting..."):
             try:
                 if raw == "1":
                     et.export_json(path, out)
@@ -1043,8 +2000,7 @@ def act_copy(et: ET):
     keep_backup = yesno("Keep a backup of the destination file?", default=False)
     backup_path = dst + "_original" if keep_backup else None
 
-    with spin("Copying tags...") as p:
-        p.add_task("", total=None)
+    with spin("Copying tags..."):
         try:
             et.copy_from(src, dst, keep_backup)
             show_result(True, "Copy tags", src, dst, backup_path)
@@ -1064,48 +2020,51 @@ MENU = [
     ("8", "Copy Tags Between Files",          act_copy,   W),
 ]
 
+MENU_TEXT = Text("\n").join(
+    [Text.from_markup(f"  [{D}]{key}[/]  [{color}]{label}[/]") for key, label, _, color in MENU]
+    + [Text(), Text.from_markup(f"  [{D}]q[/]  [{D}]Quit[/]")]
+)
 
-def main():
-    et = ET()
+DISPATCH = {key: fn for key, _, fn, _ in MENU}
 
-    while True:
-        header()
+PROMPT = Text.from_markup(f"  [{A}]→[/]  ")
+
+
+def main():
+    global NONINTERACTIVE
+    NONINTERACTIVE = not sys.stdin.isatty()
+    with ET() as et:
         try:
             ver = et.version()
         except Exception:
             ver = "?"
-
-        C.print(f"  [{D}]ExiFor {EXIFOR_VERSION}[/]  [{D}]·[/]  [{G}]ExifTool {ver}[/]\n")
-
-        for key, label, _, color in MENU:
-            C.print(f"  [{D}]{key}[/]  [{color}]{label}[/]")
-
-        C.print()
-        C.print(f"  [{D}]q[/]  [{D}]Quit[/]")
-        rule()
-        C.print(f"  [{A}]→[/]  ", end="")
-        raw = input().strip().lower()
-
-        if raw in ("q", "quit", "exit"):
-            clear()
-            C.print(f"\n  [{D}]Goodbye![/]\n")
-            sys.exit(0)
-
-        matched = False
-        for key, label, fn, _ in MENU:
-            if raw == key:
+        banner = Text.from_markup(f"  [{D}]ExiFor {EXIFOR_VERSION}[/]  [{D}]·[/]  [{G}]ExifTool {escape(ver)}[/]\n")
+
+        while True:
+            with C:
+                header()
+                C.print(banner)
+                C.print(MENU_TEXT)
+                rule()
+                C.print(PROMPT, end="")
+            raw = getch().lower()
+
+            if raw in ("q", "quit", "exit"):
+                clear()
+                C.print(f"\n  [{D}]Goodbye![/]\n")
+                sys.exit(0)
+
+            fn = DISPATCH.get(raw)
+            if fn is not None:
                 try:
                     fn(et)
                 except KeyboardInterrupt:
                     C.print()
                     warn("Interrupted")
                     pause()
-                matched = True
-                break
-
-        if not matched and raw:
-            err("Invalid choice — enter a number from the menu")
-            pause()
+            elif raw:
+                err("Invalid choice — enter a number from the menu")
+                pause()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import exifor
+
+JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f"
+    "141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101"
+    "011100ffc4001f0000010501010101010100000000000000000102030405060708090a0bffc400b5100002010303020403"
+    "050504040000017d01020300041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a1617"
+    "18191a25262728292a3435363738393a434445464748494a535455565758595a636465666768696a737475767778797a83"
+    "8485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7"
+    "d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffda0008010100003f00fbd3ffd9"
+)
+
+
+def within(fn, timeout: float = 30):
+    box = {}
+
+    def run():
+        try:
+            box["value"] = fn()
+        except BaseException as e:
+            box["error"] = e
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    t.join(timeout)
+    if t.is_alive():
+        raise AssertionError("ExifTool call did not return")
+    if "error" in box:
+        raise box["error"]
+    return box.get("value")
+
+
+@unittest.skipIf(shutil.which("exiftool") is None, "exiftool not installed")
+class ExifToolTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="exifor_test_")
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.et = exifor.ET()
+        self.addCleanup(self.et.__exit__)
+        self.jpeg = self.image("x.jpg")
+
+    def image(self, name: str) -> str:
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as f:
+            f.write(JPEG)
+        return path
+
+    def test_stay_open_commands_return(self):
+        self.assertEqual(within(lambda: self.et.read_flat(self.jpeg))["FileName"], "x.jpg")
+        within(lambda: self.et.write(self.jpeg, {"Artist": "Someone"}))
+        self.assertEqual(within(lambda: self.et.read_tags(self.jpeg, ["Artist"]))["Artist"], "Someone")
+        self.assertIsNotNone(self.et.proc)
+
+    def test_dash_leading_path(self):
+        self.image("-x.jpg")
+        cwd = os.getcwd()
+        os.chdir(self.dir)
+        self.addCleanup(os.chdir, cwd)
+        within(lambda: self.et.write("-x.jpg", {"Artist": "Someone"}))
+        self.assertEqual(within(lambda: self.et.read_tags("-x.jpg", ["Artist"]))["Artist"], "Someone")
+
+
+    def test_batched_commands_return(self):
+        sub = os.path.join(self.dir, "sub")
+        os.mkdir(sub)
+        for name in ("a.jpg", "-b.jpg"):
+            with open(os.path.join(sub, name), "wb") as f:
+                f.write(JPEG)
+        out = within(lambda: self.et.write_dir(sub, {"Artist": "Someone"}, None))
+        self.assertIn("2 image files updated", out)
+        out = within(lambda: self.et.strip_dir(sub, None))
+        self.assertIn("2 image files updated", out)
+
+    def test_strip_to_new_file(self):
+        dst = os.path.join(self.dir, "clean.jpg")
+        within(lambda: self.et.write(self.jpeg, {"Artist": "Someone"}))
+        within(lambda: self.et.strip_all_to(self.jpeg, dst))
+        self.assertNotIn("Artist", within(lambda: self.et.read_flat(dst)))
+
+
+    def test_leading_space_round_trips(self):
+        within(lambda: self.et.write(self.jpeg, {"Artist": " leading"}))
+        self.assertEqual(within(lambda: self.et.read_tags(self.jpeg, ["Artist"]))["Artist"], " leading")
+        spaced = self.image(" spaced.jpg")
+        within(lambda: self.et.write_dir(self.dir, {"Artist": " leading"}, None))
+        self.assertEqual(within(lambda: self.et.read_tags(spaced, ["Artist"]))["Artist"], " leading")
+
+
+if __name__ == "__main__":
+    unittest.main()